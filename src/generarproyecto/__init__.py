@@ -33,6 +33,7 @@ Numeración de líneas (solo art/ens):
 """
 
 import argparse
+import functools
 import os
 import re
 import shutil
@@ -40,6 +41,7 @@ import sys
 from datetime import datetime
 from importlib import resources
 from pathlib import Path
+from typing import Optional
 
 # En consolas de Windows (cmd.exe) sin code page UTF-8, imprimir los símbolos
 # usados en los mensajes (✓, →, ─, ⚠) puede lanzar UnicodeEncodeError. Se
@@ -95,9 +97,16 @@ def resolver_templates_dir() -> Path:
     return dir_usuario
 
 
-# Directorio donde viven las plantillas (ver resolver_templates_dir() para
-# el orden de prioridad).
-TEMPLATES_DIR = resolver_templates_dir()
+@functools.cache
+def templates_dir() -> Path:
+    """
+    Directorio donde viven las plantillas (ver resolver_templates_dir() para
+    el orden de prioridad). Se resuelve en el primer uso y no al importar, así
+    `--listar` no paga Path.home(), la comprobación de ~/.latex-templates ni la
+    búsqueda de las plantillas embebidas con importlib.resources.
+    """
+    return resolver_templates_dir()
+
 
 # Mapeo de tipos cortos a nombres de plantilla y descripciones
 TIPOS = {
@@ -189,6 +198,60 @@ LADOS_LINEA = {
 LINEAS_LADO_DEFAULT = "izquierda"
 LINEAS_MODULO_DEFAULT = 1
 
+# Meses en español (evita depender del locale del sistema). Se indexa
+# directamente con datetime.month, por eso la posición 0 queda vacía.
+_MESES_ES = (
+    "", "enero", "febrero", "marzo", "abril", "mayo", "junio", "julio",
+    "agosto", "septiembre", "octubre", "noviembre", "diciembre",
+)
+
+# .gitignore de cada proyecto, ya codificado: se escribe tal cual.
+_GITIGNORE_BYTES = """# LaTeX auxiliares
+*.aux
+*.bbl
+*.bcf
+*.blg
+*.log
+*.nav
+*.out
+*.run.xml
+*.snm
+*.toc
+*.vrb
+*.fdb_latexmk
+*.fls
+*.synctex.gz
+
+# PDF generado (descomenta si no quieres versionarlo)
+# *.pdf
+""".encode("utf-8")
+
+# Documento mínimo que se genera si falta la plantilla del tipo pedido.
+_TEX_MINIMO = (
+    "\\documentclass{{{clase}}}\n"
+    "\\title{{{titulo}}}\n"
+    "\\author{{{autor}}}\n"
+    "\\date{{{fecha}}}\n"
+    "\\begin{{document}}\n"
+    "\\maketitle\n\n"
+    "\\end{{document}}\n"
+)
+
+# Tabla de slugify() para quitar acentos en una sola pasada con str.translate.
+_ACCENT_TABLE = str.maketrans({
+    "á": "a", "é": "e", "í": "i", "ó": "o", "ú": "u",
+    "Á": "A", "É": "E", "Í": "I", "Ó": "O", "Ú": "U",
+    "ñ": "n", "Ñ": "N", "ü": "u", "Ü": "U",
+})
+
+# Patrones de slugify(), compilados una sola vez al importar el módulo.
+_RE_NONWORD = re.compile(r"[^\w\s-]")
+_RE_SPACES = re.compile(r"[\s_]+")
+_RE_DASHES = re.compile(r"-+")
+
+# Placeholder de las plantillas: {{CLAVE}}.
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
 
 # ============================================================================
 # Funciones auxiliares
@@ -200,37 +263,70 @@ def slugify(texto: str) -> str:
     "Mi artículo sobre IA" → "mi-articulo-sobre-ia"
     """
     # Reemplazos de caracteres acentuados
-    reemplazos = {
-        "á": "a", "é": "e", "í": "i", "ó": "o", "ú": "u",
-        "Á": "A", "É": "E", "Í": "I", "Ó": "O", "Ú": "U",
-        "ñ": "n", "Ñ": "N", "ü": "u", "Ü": "U",
-    }
-    for original, reemplazo in reemplazos.items():
-        texto = texto.replace(original, reemplazo)
+    texto = texto.translate(_ACCENT_TABLE)
+
+    # Caso común: solo letras, dígitos y espacios ASCII. Las tres regex no
+    # harían nada más que unir las palabras con guiones.
+    if texto.isascii() and texto.replace(" ", "").isalnum():
+        return "-".join(texto.lower().split())
 
     # Convertir a minúsculas, reemplazar espacios y caracteres no alfanuméricos
     texto = texto.lower().strip()
-    texto = re.sub(r"[^\w\s-]", "", texto)
-    texto = re.sub(r"[\s_]+", "-", texto)
-    texto = re.sub(r"-+", "-", texto)
+    texto = _RE_NONWORD.sub("", texto)
+    texto = _RE_SPACES.sub("-", texto)
+    texto = _RE_DASHES.sub("-", texto)
     return texto.strip("-")
 
 
 def sustituir_placeholders(contenido: str, variables: dict) -> str:
-    """Reemplaza los placeholders {{CLAVE}} en el contenido."""
-    for clave, valor in variables.items():
-        contenido = contenido.replace(f"{{{{{clave}}}}}", valor)
-    return contenido
+    """
+    Reemplaza los placeholders {{CLAVE}} en el contenido, en una sola pasada.
+    Los placeholders sin variable asociada se dejan intactos.
+    """
+    return _PLACEHOLDER_RE.sub(
+        lambda m: variables.get(m.group(1), m.group(0)), contenido
+    )
+
+
+@functools.lru_cache
+def _leer_plantilla_cacheada(origen: Path, mtime_ns: int, tamano: int) -> str:
+    # Saltos normalizados como en modo texto: una plantilla con CRLF (p. ej.
+    # clonada en Windows con core.autocrlf) no deja `\r` sueltos que rompan
+    # las recetas del Makefile.
+    texto = origen.read_bytes().decode("utf-8")
+    return texto.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _leer_plantilla(origen: Path) -> str:
+    """
+    Lee una plantilla reutilizando la lectura anterior si el archivo no ha
+    cambiado. Al generar varios proyectos desde Python se evita volver a leer
+    y decodificar el archivo; la clave incluye mtime y tamaño para que una
+    plantilla editada entre dos generaciones se relea.
+    """
+    info = origen.stat()
+    return _leer_plantilla_cacheada(origen, info.st_mtime_ns, info.st_size)
 
 
 def copiar_plantilla(origen: Path, destino: Path, variables: dict):
-    """Copia un archivo de plantilla sustituyendo los placeholders."""
-    contenido = origen.read_text(encoding="utf-8")
-    contenido = sustituir_placeholders(contenido, variables)
+    """
+    Copia un archivo de plantilla sustituyendo los placeholders. Si la
+    plantilla no contiene ningún `{{`, se escribe tal cual, sin pasar por la
+    sustitución.
+
+    Las plantillas incluidas siempre pasan por la sustitución: Makefile y
+    referencias.bib llevan placeholders y los .tex usan `\\graphicspath{{...}}`.
+    El atajo solo sirve a plantillas propias sin placeholders.
+    """
+    contenido = _leer_plantilla(origen)
+    if "{{" in contenido:
+        contenido = sustituir_placeholders(contenido, variables)
     destino.write_text(contenido, encoding="utf-8")
 
 
-def resolver_plantilla(tipo: str, formato: str) -> Path:
+def resolver_plantilla(
+    tipo: str, formato: str, presentes: Optional[set] = None
+) -> Path:
     """
     Devuelve la ruta de la plantilla para el par (tipo, formato).
 
@@ -238,20 +334,36 @@ def resolver_plantilla(tipo: str, formato: str) -> Path:
     esa; si no, se cae en la plantilla base del tipo. Así un formato puede
     cubrir solo algunos tipos sin romper el resto: 'hep' aporta articulo-hep.tex
     y los demás tipos siguen usando su plantilla de siempre.
+
+    `presentes` es el conjunto de nombres que devuelve verificar_plantillas();
+    si se pasa, la variante se busca ahí en lugar de consultar el disco.
     """
+    plantillas = templates_dir()
     base = TIPOS[tipo]["plantilla"]
     sufijo = FORMATOS[formato]["sufijo"]
     if sufijo:
-        variante = TEMPLATES_DIR / base.replace(".tex", f"{sufijo}.tex")
-        if variante.exists():
-            return variante
-    return TEMPLATES_DIR / base
+        variante = base.replace(".tex", f"{sufijo}.tex")
+        if presentes is None:
+            existe = (plantillas / variante).exists()
+        else:
+            existe = variante in presentes
+        if existe:
+            return plantillas / variante
+    return plantillas / base
 
 
-def verificar_plantillas():
-    """Verifica que el directorio de plantillas existe y tiene los archivos."""
-    if not TEMPLATES_DIR.exists():
-        print(f"Error: No se encontró el directorio de plantillas: {TEMPLATES_DIR}")
+def verificar_plantillas() -> set:
+    """
+    Verifica que el directorio de plantillas existe y tiene los archivos.
+    Devuelve el conjunto de nombres presentes en el directorio.
+    """
+    plantillas = templates_dir()
+    # Un solo listado del directorio en lugar de un stat por archivo.
+    try:
+        with os.scandir(plantillas) as entradas:
+            presentes = {e.name for e in entradas}
+    except (FileNotFoundError, NotADirectoryError):
+        print(f"Error: No se encontró el directorio de plantillas: {plantillas}")
         print()
         print("Para instalar las plantillas, ejecuta el instalador incluido:")
         print("  bash instalar.sh          (Linux/macOS)")
@@ -263,17 +375,24 @@ def verificar_plantillas():
         print()
         print("También puedes definir LATEX_TEMPLATES_DIR apuntando a tu propio directorio de plantillas.")
         sys.exit(1)
+    except OSError as error:
+        # Existe pero no se puede listar (p. ej. sin permiso de lectura).
+        print(f"Error: No se pudo leer el directorio de plantillas: {plantillas}")
+        print(f"  {error.strerror}")
+        sys.exit(1)
 
     archivos_necesarios = ["articulo.tex", "articulo-hep.tex", "ensayo.tex",
                            "presentacion.tex", "referencias.bib", "Makefile"]
-    faltantes = [a for a in archivos_necesarios if not (TEMPLATES_DIR / a).exists()]
+    faltantes = [a for a in archivos_necesarios if a not in presentes]
 
     if faltantes:
-        print(f"Advertencia: Faltan plantillas en {TEMPLATES_DIR}:")
+        print(f"Advertencia: Faltan plantillas en {plantillas}:")
         for f in faltantes:
             print(f"  - {f}")
         print()
 
+    return presentes
+
 
 # ============================================================================
 # Función principal
@@ -305,7 +424,7 @@ def crear_proyecto(
         print(f"Formatos disponibles: {', '.join(FORMATOS.keys())}")
         sys.exit(1)
 
-    verificar_plantillas()
+    presentes = verificar_plantillas()
 
     # La numeración de líneas no aplica a presentaciones (beamer)
     if numeracion_lineas and tipo not in TIPOS_CON_NUMERACION_LINEAS:
@@ -318,14 +437,8 @@ def crear_proyecto(
     # Generar nombre del directorio y archivo
     slug = slugify(nombre)
     info_tipo = TIPOS[tipo]
-    # Meses en español (evita depender del locale del sistema)
-    meses_es = {
-        1: "enero", 2: "febrero", 3: "marzo", 4: "abril",
-        5: "mayo", 6: "junio", 7: "julio", 8: "agosto",
-        9: "septiembre", 10: "octubre", 11: "noviembre", 12: "diciembre",
-    }
     hoy = datetime.now()
-    fecha = f"{hoy.day} de {meses_es[hoy.month]} de {hoy.year}"
+    fecha = f"{hoy.day} de {_MESES_ES[hoy.month]} de {hoy.year}"
 
     # Estilo de citas
     info_citas = ESTILOS_CITAS[citas]
@@ -371,28 +484,26 @@ def crear_proyecto(
     (dir_proyecto / "figuras").mkdir()
 
     # Copiar y procesar la plantilla principal
-    plantilla_origen = resolver_plantilla(tipo, formato)
+    plantilla_origen = resolver_plantilla(tipo, formato, presentes)
     archivo_tex = dir_proyecto / f"{slug}.tex"
 
-    if plantilla_origen.exists():
+    if plantilla_origen.name in presentes:
         copiar_plantilla(plantilla_origen, archivo_tex, variables)
     else:
         print(f"Advertencia: No se encontró {plantilla_origen}")
         print(f"Creando archivo .tex mínimo...")
         archivo_tex.write_text(
-            f"\\documentclass{{{info_tipo['clase']}}}\n"
-            f"\\title{{{nombre}}}\n"
-            f"\\author{{{autor}}}\n"
-            f"\\date{{{fecha}}}\n"
-            f"\\begin{{document}}\n"
-            f"\\maketitle\n\n"
-            f"\\end{{document}}\n",
+            _TEX_MINIMO.format(
+                clase=info_tipo["clase"], titulo=nombre, autor=autor, fecha=fecha
+            ),
             encoding="utf-8"
         )
 
+    plantillas = templates_dir()
+
     # Copiar referencias.bib
-    bib_origen = TEMPLATES_DIR / "referencias.bib"
-    if bib_origen.exists():
+    bib_origen = plantillas / "referencias.bib"
+    if "referencias.bib" in presentes:
         copiar_plantilla(bib_origen, dir_proyecto / "referencias.bib", variables)
     else:
         (dir_proyecto / "referencias.bib").write_text(
@@ -400,31 +511,12 @@ def crear_proyecto(
         )
 
     # Copiar Makefile
-    makefile_origen = TEMPLATES_DIR / "Makefile"
-    if makefile_origen.exists():
+    makefile_origen = plantillas / "Makefile"
+    if "Makefile" in presentes:
         copiar_plantilla(makefile_origen, dir_proyecto / "Makefile", variables)
 
     # Crear .gitignore para LaTeX
-    gitignore_contenido = """# LaTeX auxiliares
-*.aux
-*.bbl
-*.bcf
-*.blg
-*.log
-*.nav
-*.out
-*.run.xml
-*.snm
-*.toc
-*.vrb
-*.fdb_latexmk
-*.fls
-*.synctex.gz
-
-# PDF generado (descomenta si no quieres versionarlo)
-# *.pdf
-"""
-    (dir_proyecto / ".gitignore").write_text(gitignore_contenido, encoding="utf-8")
+    (dir_proyecto / ".gitignore").write_bytes(_GITIGNORE_BYTES)
 
     # Resumen final
     print()
@@ -2,9 +2,10 @@
 Configuración común de los tests.
 
 El aislamiento de plantillas de este archivo NO es opcional. El módulo
-`generarproyecto` congela el directorio de plantillas en tiempo de import:
+`generarproyecto` congela el directorio de plantillas la primera vez que se usa:
 
-    TEMPLATES_DIR = resolver_templates_dir()   # nivel de módulo
+    @functools.cache
+    def templates_dir(): return resolver_templates_dir()
 
 y `resolver_templates_dir()` da prioridad a `~/.latex-templates` sobre las
 plantillas embebidas en el paquete. En una máquina donde se haya ejecutado
@@ -13,7 +14,7 @@ del usuario y no contra las del repositorio, dando resultados que no dicen nada
 sobre el código bajo prueba.
 
 Por eso el entorno se fija aquí, a nivel de módulo: pytest importa `conftest.py`
-antes que cualquier módulo de test, así que esto ocurre antes del import.
+antes que cualquier módulo de test, así que esto ocurre antes del primer uso.
 """
 
 import importlib
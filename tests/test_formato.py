@@ -93,6 +93,14 @@ def test_resolver_plantilla_elige_la_variante_hep(plantillas):
     assert g.resolver_plantilla("art", "clasico") == plantillas / "articulo.tex"
 
 
+def test_resolver_plantilla_usa_los_nombres_presentes(plantillas):
+    """Con el listado de verificar_plantillas() no se consulta el disco."""
+    assert g.resolver_plantilla("art", "hep", {"articulo.tex"}) == plantillas / "articulo.tex"
+    assert g.resolver_plantilla("art", "hep", g.verificar_plantillas()) == (
+        plantillas / "articulo-hep.tex"
+    )
+
+
 @pytest.mark.parametrize("tipo, esperado", [
     ("ens", "ensayo.tex"),
     ("pres", "presentacion.tex"),
@@ -1,5 +1,6 @@
 """Generación de proyectos: estructura y contenido de lo que sale."""
 
+import os
 import re
 
 import pytest
@@ -88,3 +89,71 @@ def test_directorio_existente_sale_con_error(generar, tmp_path):
             citas=g.CITAS_DEFAULT, directorio_base=tmp_path,
         )
     assert excinfo.value.code == 1
+
+
+def test_sin_directorio_de_plantillas_sale_con_error(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr(g, "templates_dir", lambda: tmp_path / "no-existe")
+    with pytest.raises(SystemExit) as excinfo:
+        g.verificar_plantillas()
+    assert excinfo.value.code == 1
+    assert "No se encontró el directorio de plantillas" in capsys.readouterr().out
+
+
+def test_directorio_de_plantillas_ilegible_sale_con_error(monkeypatch, tmp_path, capsys):
+    """Sin permiso de lectura, scandir falla: error claro, no un traceback."""
+    def sin_permiso(ruta):
+        raise PermissionError(13, "Permission denied", str(ruta))
+
+    monkeypatch.setattr(g, "templates_dir", lambda: tmp_path)
+    monkeypatch.setattr(g.os, "scandir", sin_permiso)
+    with pytest.raises(SystemExit) as excinfo:
+        g.verificar_plantillas()
+    assert excinfo.value.code == 1
+    assert "No se pudo leer el directorio de plantillas" in capsys.readouterr().out
+
+
+def test_plantilla_sin_placeholders_se_copia_tal_cual(tmp_path):
+    origen = tmp_path / "origen"
+    origen.write_bytes(b"all:\n\tpdflatex doc.tex\n")
+    destino = tmp_path / "destino"
+    g.copiar_plantilla(origen, destino, {"TITULO": "X"})
+    assert destino.read_bytes() == origen.read_bytes()
+
+
+@pytest.mark.parametrize("contenido, esperado", [
+    (b"MAIN = {{NOMBRE_ARCHIVO}}\r\nall:\r\n\tpdflatex $(MAIN)\r\n",
+     "MAIN = x\nall:\n\tpdflatex $(MAIN)\n"),
+    (b"all:\r\n\tpdflatex doc.tex\r\n", "all:\n\tpdflatex doc.tex\n"),
+])
+def test_plantilla_con_crlf_sale_con_saltos_del_sistema(tmp_path, contenido, esperado):
+    """
+    Una plantilla con CRLF (clonada en Windows con core.autocrlf) no debe dejar
+    `\\r` sueltos: romperían las recetas del Makefile.
+    """
+    origen = tmp_path / "Makefile.origen"
+    origen.write_bytes(contenido)
+    destino = tmp_path / "Makefile"
+    g.copiar_plantilla(origen, destino, {"NOMBRE_ARCHIVO": "x"})
+    assert destino.read_bytes() == esperado.replace("\n", os.linesep).encode("utf-8")
+
+
+def test_plantilla_editada_entre_copias_se_relee(tmp_path):
+    """La caché de lecturas no debe servir una plantilla ya modificada."""
+    origen = tmp_path / "origen"
+    destino = tmp_path / "destino"
+    origen.write_text("sin placeholders\n", encoding="utf-8")
+    g.copiar_plantilla(origen, destino, {"TITULO": "X"})
+    assert destino.read_text(encoding="utf-8") == "sin placeholders\n"
+
+    origen.write_text("Título: {{TITULO}}\n", encoding="utf-8")
+    g.copiar_plantilla(origen, destino, {"TITULO": "X"})
+    assert destino.read_text(encoding="utf-8") == "Título: X\n"
+
+    origen.write_text("Proyecto: {{TITULO}}\n", encoding="utf-8")
+    g.copiar_plantilla(origen, destino, {"TITULO": "X"})
+    assert destino.read_text(encoding="utf-8") == "Proyecto: X\n"
+
+    # Reguardada con CRLF: la versión cacheada también debe normalizarse.
+    origen.write_bytes(b"Proyecto: {{TITULO}}\r\nFin\r\n")
+    g.copiar_plantilla(origen, destino, {"TITULO": "X"})
+    assert destino.read_bytes() == f"Proyecto: X{os.linesep}Fin{os.linesep}".encode()
@@ -15,6 +15,8 @@ import generarproyecto as g
     ("guiones---repetidos", "guiones-repetidos"),
     ("  bordes  ", "bordes"),
     ("snake_case_texto", "snake-case-texto"),
+    ("Parte 1 - Introducción", "parte-1-introduccion"),
+    ("Tesis 2026", "tesis-2026"),
 ])
 def test_slugify(entrada, esperado):
     assert g.slugify(entrada) == esperado